@@ -18,7 +18,7 @@ Provides essential classes and methods for proving predicate logic statements.
 from copy import deepcopy
 from dataclasses import dataclass, field
 from enum import Enum
-from itertools import combinations
+from itertools import combinations, compress
 import random
 from typing import Any, List, Optional, Set, Tuple
 
@@ -157,6 +157,12 @@ class ProofBase:
         return self.stateTags[0] == StateTag.AXIOM and \
         all(tag == StateTag.LEMMA for tag in self.stateTags[1:])
 
+    def axioms(self) -> Tuple[Statement, ...]:
+        """
+        Returns the statements tagged as axioms, in order.
+        """
+        return tuple(compress(self.statements, [tag is StateTag.AXIOM for tag in self.stateTags]))
+
     def symsWithout(self, stateIndex) -> Set[Tuple]:
         """
         Returns vars and preds used in proof, without the statement on specified index.
@@ -694,7 +700,7 @@ class ProofBase:
                     func = Statement(premise1[start - 1 : end + 1])
                     args = func.functionArgs()
                     assert args is not None, 'Impossible error.'
-                    if any(len(tuple(arg)) != 1 for arg in args):
+                    if any(len(arg) != 1 for arg in args):
                         continue
                     calc = Statement.calcFunction(
                         func[0][1],
@@ -1039,7 +1045,7 @@ class Proof(ProofBase):
                     )[0][0]
                 except TypeError: pass
                 else:
-                    if Bx == Bx2 and len(tuple(object)) == 1:
+                    if Bx == Bx2 and len(object) == 1:
                         x = premise4[3]
                         y = object[0]
                         conclusions.append(
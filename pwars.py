@@ -18,19 +18,20 @@ Provides essential classes and methods for the gameplay.
 from dataclasses import dataclass, field
 from enum import Enum
 import itertools
+from operator import delitem, itemgetter, setitem
 import random
 import types
-from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
 from predicate.statement import baseRules, symbolsType
-from predicate.proof import Proof, ProofBase, StateTag, Statement
+from predicate.proof import Proof, ProofBase, Statement
 from predicate.utils import doOperator
 from utilclasses import LazyDict
 
 #REMINDER: Add features in order, in separate commits, one by one...
 #REMINDER: When adding player action features, update:
 #          - PlayerActionType variable
-#          - PlayerAction.valid function
+#          - _VALIDATORS table (info validator for PlayerAction.valid)
 #          - PActInfoType variable
 #          - PWars.nextGameState
 #            (if changes in game based on player actions happens after game state & optional)
@@ -40,14 +41,10 @@ from utilclasses import LazyDict
 #REMINDER: When adding game state features, update:
 #          - GameStateType variable
 #          - GStateInfoType variable
-#          - PWars.nextGameState
+#          - _NEXTSTATE_DISPATCH table (transitions for PWars.nextGameState)
 #          - PWars.advance (optional)
 
 
-def _allUnique(iter: Iterable, key: Callable = lambda x: x) -> bool:
-    seenKeys = list()
-    return not any(key(i) in seenKeys or seenKeys.append(key(i)) for i in iter)
-
 def _mergeItersWithDelimiter(iters: Iterable[Iterable], delimiter: Any):
     for i, itera in enumerate(iters):
         if i > 0: yield delimiter
@@ -61,30 +58,44 @@ class CardTag(Enum):
     ROCK = 0
     PAPER = 1
     SCISSORS = 2
-    def beat(self, oppoTag: 'CardTag'):
-        if (self is CardTag.ROCK and oppoTag is CardTag.SCISSORS):
-            return True
-        if (self is CardTag.PAPER and oppoTag is CardTag.ROCK):
-            return True
-        if (self is CardTag.SCISSORS and oppoTag is CardTag.PAPER):
-            return True
-        return False
+    def beat(self, oppoTag: 'CardTag') -> bool:
+        return _BEAT[self.value][oppoTag.value]
 
-@dataclass
+#Whether the row tag beats the column tag, indexed by CardTag value
+_BEAT = (
+    (False, False, True), #ROCK beats SCISSORS
+    (True, False, False), #PAPER beats ROCK
+    (False, True, False), #SCISSORS beats PAPER
+)
+
+@dataclass(slots=True)
 class Card:
     blank: bool = True
     tag: CardTag | None = None
     powerCost: int | None = None
     effect: Statement | None = None
     creator: int | None = None
+    #(symbols of the effect, their symbol point)
+    _effectPoint: Tuple[Tuple, int] | None = field(default=None, init=False, repr=False, compare=False)
     def edit(self, tag: CardTag, powerCost: int, effect: Statement, creator: int):
         self.tag = tag
         self.powerCost = powerCost
         self.effect = effect
         self.creator = creator
         self.blank = False
+    def symbolPoint(self) -> int:
+        """
+        Returns the symbol point of the card's effect, only recalculated when the effect changes.
+        """
+        symbols = self.effect.statement
+        if self._effectPoint is None or self._effectPoint[0] is not symbols:
+            self._effectPoint = (symbols, self.effect.symbolPoint())
+        return self._effectPoint[1]
 
-@dataclass
+#Blank card to compare against, never put it in a hand or the deck
+_BLANK_CARD = Card()
+
+@dataclass(slots=True)
 class Player:
     health: int
     power: int = 100
@@ -93,7 +104,7 @@ class Player:
     pPower: int = 0
     subproofs: List[ProofBase] = field(default_factory=list)
     def editCard(self, cardID: int, toCard: Card, blankCost: bool = False) -> bool:
-        if self.cards[cardID] == Card():
+        if self.cards[cardID] == _BLANK_CARD:
             if (not blankCost) or (blankCost and toCard.powerCost):
                 self.cards[cardID] = toCard
                 if blankCost:
@@ -145,17 +156,49 @@ GStateInfoType = {
     GameStateType.RANDPLAYER: int,
 }
 
-@dataclass
+#Enum members used by the state machine, bound once since looking them up on the class is slow
+#GameStateType members used by GameState and PWars
+_GS_TURN = GameStateType.TURN
+_GS_RANDPLAYER = GameStateType.RANDPLAYER
+_GS_PROVE = GameStateType.PROVE
+_GS_EFFECT = GameStateType.EFFECT
+_GS_SUBPROOF = GameStateType.SUBPROOF
+_GS_ADDRULE = GameStateType.ADDRULE
+
+def _stateKey(layer: int, type: GameStateType) -> int:
+    """
+    Packs the layer and type of a game state into a single int.
+    """
+    return (layer << 8) | type.value
+
+@dataclass(slots=True, frozen=True)
 class GameState:
     layer: int
     type: GameStateType
     info: Any = None
+    _key: int = field(init=False, repr=False, compare=False)
+    def __post_init__(self):
+        object.__setattr__(self, '_key', _stateKey(self.layer, self.type))
+    def pack(self) -> int:
+        """
+        Packs the game state into a single int: type in the lowest 8 bits,
+        then layer in the next 8 bits, then info (if integer) in the rest.
+        """
+        return ((self.info or 0) << 16) | self._key
+    @staticmethod
+    def unpack(packed: int) -> 'GameState':
+        """
+        Unpacks a game state packed by `GameState.pack`.
+        """
+        stateType = GameStateType(packed & 0xff)
+        info = packed >> 16 if GStateInfoType.get(stateType) is int else None
+        return GameState((packed >> 8) & 0xff, stateType, info)
     @staticmethod
     def randPlayer(self: 'PWars', layer: int) -> 'GameState':
         """
         Generates RANDPLAYER game state.
         """
-        return GameState(layer, GameStateType.RANDPLAYER, random.randint(0, len(self.players) - 1))
+        return GameState(layer, _GS_RANDPLAYER, random.randint(0, len(self.players) - 1))
     @staticmethod
     def nextTurn(self: 'PWars', turn: 'GameState', main: bool = False) -> 'GameState':
         """
@@ -163,17 +206,38 @@ class GameState:
         """
         assert not main or len(self.players) == len(self.remaining), 'Wrong size of `remaining`'
 
-        if turn.type == GameStateType.TURN:
-            player = (turn.info + 1) % len(self.players)
-            for _ in range(self.INITPLAYER):
+        if turn.type is _GS_TURN:
+            playerCount = len(self.players)
+            player = (turn.info + 1) % playerCount
+            for _ in range(playerCount):
                 if (not main) or (main and self.remaining[player]):
                     break
-                player = (player + 1) % len(self.players)
+                player = (player + 1) % playerCount
             else:
                 raise GameException('Impossible error.')
-            return GameState(turn.layer, GameStateType.TURN, player)
+            return GameState(turn.layer, _GS_TURN, player)
         else: raise ValueError("Not a Turn")
 
+_INITIAL_L0 = _stateKey(0, GameStateType.INITIAL)
+_CREATION_L0 = _stateKey(0, GameStateType.CREATION)
+_EDITING_L0 = _stateKey(0, GameStateType.EDITING)
+_CLAIMING_L0 = _stateKey(0, GameStateType.CLAIMING)
+_MAIN_L0 = _stateKey(0, GameStateType.MAIN)
+_FINAL_L0 = _stateKey(0, GameStateType.FINAL)
+
+#Game states are frozen, so the ones without info are shared instead of rebuilt
+_INITIAL_STATE = GameState(0, GameStateType.INITIAL)
+_CREATION_STATE = GameState(0, GameStateType.CREATION)
+_EDITING_STATE = GameState(0, GameStateType.EDITING)
+_CLAIMING_STATE = GameState(0, GameStateType.CLAIMING)
+_MAIN_STATE = GameState(0, GameStateType.MAIN)
+_FINAL_STATE = GameState(0, GameStateType.FINAL)
+_MAINPROVE_STATE = GameState(3, GameStateType.PROVE)
+_MAINEFFECT_STATE = GameState(3, GameStateType.EFFECT)
+_SUBPROOF_STATE = GameState(1, GameStateType.SUBPROOF)
+_ADDRULE_STATE = GameState(1, GameStateType.ADDRULE)
+_FINALPROVE_STATE = GameState(2, GameStateType.PROVE)
+
 class PlayerActionType(Enum):
     EDIT = 0
     TAKEBLANK = 1
@@ -192,70 +256,119 @@ class PlayerActionType(Enum):
 
     DEBUGACT = 11
 
-@dataclass
+#PlayerActionType members used by PlayerAction.valid and PWars
+_PA_EDIT = PlayerActionType.EDIT
+_PA_TAKEBLANK = PlayerActionType.TAKEBLANK
+_PA_CLAIM = PlayerActionType.CLAIM
+_PA_PLAY = PlayerActionType.PLAY
+_PA_DISCARD = PlayerActionType.DISCARD
+_PA_CLAIMPLAY = PlayerActionType.CLAIMPLAY
+_PA_UNREMAIN = PlayerActionType.UNREMAIN
+_PA_PROVE = PlayerActionType.PROVE
+_PA_EFFECTCHOOSE = PlayerActionType.EFFECTCHOOSE
+_PA_SUBPROOF = PlayerActionType.SUBPROOF
+_PA_ADDRULE = PlayerActionType.ADDRULE
+_PA_DEBUGACT = PlayerActionType.DEBUGACT
+
+#Player actions allowed on a player's turn in the main phase
+_MAINPHASE_TYPES = frozenset({
+    PlayerActionType.PLAY,
+    PlayerActionType.DISCARD,
+    PlayerActionType.CLAIMPLAY,
+    PlayerActionType.UNREMAIN,
+})
+
+def _validEdit(info: Any) -> bool:
+    return isinstance(info, Tuple) and \
+    all(
+        isinstance(editing, Tuple) and \
+        isinstance(editing[0], int) and \
+        isinstance(editing[1], Card) and \
+        editing[1] != _BLANK_CARD
+        for editing in info
+    )
+
+def _validTakeBlank(info: Any) -> bool:
+    return isinstance(info, int) and info >= 0 and info <= FAIR_NUMBER
+
+def _validClaim(info: Any) -> bool:
+    return isinstance(info, list) and \
+    all(
+        isinstance(claim, tuple) and len(claim) == 2 and \
+        isinstance(claim[0], int) and isinstance(claim[1], int)
+        for claim in info
+    )
+
+def _validPlay(info: Any) -> bool:
+    return isinstance(info, tuple) and len(info) == 2 and \
+    isinstance(info[0], int) and isinstance(info[1], int)
+
+def _validDiscard(info: Any) -> bool:
+    return isinstance(info, int)
+
+def _validUnremain(info: Any) -> bool:
+    return info is None
+
+def _validProve(info: Any) -> bool:
+    return isinstance(info, tuple) and len(info) == 3 and \
+        isinstance(info[0], (int, types.NoneType)) and \
+        isinstance(info[1], Proof) and \
+        isinstance(info[2], int)
+
+def _validEffectChoose(info: Any) -> bool:
+    return isinstance(info, tuple) and len(info) == 3 and \
+        isinstance(info[0], int) and \
+        all(
+            isinstance(part, dict) and
+            all(isinstance(key, int) and isinstance(value, int)
+                for key, value in part.items())
+            for part in info[1:]
+        )
+
+def _validSubproof(info: Any) -> bool:
+    return isinstance(info, ProofBase)
+
+def _validAddRule(info: Any) -> bool:
+    return isinstance(info, Tuple) and \
+    len(info) == 3 and \
+    isinstance(info[0], int) and isinstance(info[1], Statement) and \
+    isinstance(info[2], int)
+
+def _validDebugAct(info: Any) -> bool:
+    return True
+
+#Info validators indexed by PlayerActionType value, None for types without one
+_VALIDATORS: List[Callable[[Any], bool] | None] = [None] * (max(actType.value for actType in PlayerActionType) + 1)
+_VALIDATORS[PlayerActionType.EDIT.value] = _validEdit
+_VALIDATORS[PlayerActionType.TAKEBLANK.value] = _validTakeBlank
+_VALIDATORS[PlayerActionType.CLAIM.value] = _validClaim
+_VALIDATORS[PlayerActionType.PLAY.value] = _validPlay
+_VALIDATORS[PlayerActionType.DISCARD.value] = _validDiscard
+_VALIDATORS[PlayerActionType.CLAIMPLAY.value] = _validClaim
+_VALIDATORS[PlayerActionType.UNREMAIN.value] = _validUnremain
+_VALIDATORS[PlayerActionType.PROVE.value] = _validProve
+_VALIDATORS[PlayerActionType.EFFECTCHOOSE.value] = _validEffectChoose
+_VALIDATORS[PlayerActionType.SUBPROOF.value] = _validSubproof
+_VALIDATORS[PlayerActionType.ADDRULE.value] = _validAddRule
+_VALIDATORS[PlayerActionType.DEBUGACT.value] = _validDebugAct
+
+@dataclass(slots=True)
 class PlayerAction:
     player: int
     type: PlayerActionType
     info: Any = None
-    def valid(self, typeReq: None | PlayerActionType | Tuple[PlayerActionType] = None) -> bool:
+    def valid(
+            self,
+            typeReq: None | PlayerActionType | Tuple[PlayerActionType] | FrozenSet[PlayerActionType] = None
+        ) -> bool:
         if isinstance(typeReq, PlayerActionType):
-            if not self.type == typeReq: return False
-        elif (isinstance(typeReq, tuple)):
+            if self.type is not typeReq: return False
+        elif (isinstance(typeReq, (tuple, frozenset))):
             if not self.type in typeReq: return False
         #Specific checks
-        if self.type == PlayerActionType.EDIT:
-            return isinstance(self.info, Tuple) and \
-            all(
-                isinstance(editing, Tuple) and \
-                isinstance(editing[0], int) and \
-                isinstance(editing[1], Card) and \
-                editing[1] != Card()
-                for editing in self.info
-            )
-        elif self.type == PlayerActionType.TAKEBLANK:
-            return isinstance(self.info, int) and self.info >= 0 and self.info <= FAIR_NUMBER
-        elif self.type == PlayerActionType.CLAIM:
-            return isinstance(self.info, list) and \
-            all(isinstance(claim, tuple) and len(claim) == 2 and \
-            all(isinstance(num, int) for num in claim) for claim in self.info)
-        elif self.type == PlayerActionType.PLAY:
-            return isinstance(self.info, tuple) and len(self.info) == 2 and \
-            all(isinstance(x, int) for x in self.info)
-        elif self.type == PlayerActionType.DISCARD:
-            return isinstance(self.info, int)
-        elif self.type == PlayerActionType.UNREMAIN:
-            return self.info is None
-        elif self.type == PlayerActionType.CLAIMPLAY:
-            return isinstance(self.info, list) and \
-            all(
-                isinstance(claim, tuple) and len(claim) == 2 and \
-                all(isinstance(num, int) for num in claim)
-                for claim in self.info
-            )
-        elif self.type == PlayerActionType.PROVE:
-            return isinstance(self.info, tuple) and len(self.info) == 3 and \
-                isinstance(self.info[0], (int, types.NoneType)) and \
-                isinstance(self.info[1], Proof) and \
-                isinstance(self.info[2], int)
-        elif self.type == PlayerActionType.EFFECTCHOOSE:
-            return isinstance(self.info, tuple) and len(self.info) == 3 and \
-                isinstance(self.info[0], int) and \
-                all(
-                    isinstance(part, dict) and
-                    all(isinstance(key, int) and isinstance(value, int)
-                        for key, value in part.items())
-                    for part in self.info[1:]
-                )
-        elif self.type == PlayerActionType.SUBPROOF:
-            return isinstance(self.info, ProofBase)
-        elif self.type == PlayerActionType.ADDRULE:
-            return isinstance(self.info, Tuple) and \
-            len(self.info) == 3 and \
-            isinstance(self.info[0], int) and isinstance(self.info[1], Statement) and \
-            isinstance(self.info[2], int)
-
-        elif self.type == PlayerActionType.DEBUGACT: return True
-        else: raise ValueError('Invalid type')
+        validator = _VALIDATORS[self.type.value]
+        if validator is None: raise ValueError('Invalid type')
+        return validator(self.info)
 
 PActInfoType = {
     PlayerActionType.EDIT: Tuple[Tuple[int, Card]],
@@ -278,6 +391,78 @@ PActInfoType = {
 class GameException(Exception):
     pass
 
+#Game state transitions, each one returns the next game states
+#or None if the player actions don't allow advancing yet
+def _fromInitial(self: 'PWars', gameStates: Tuple[GameState, ...], playerActs: List[PlayerAction]) -> List[GameState] | None:
+    return [_CREATION_STATE]
+
+def _fromCreation(self: 'PWars', gameStates: Tuple[GameState, ...], playerActs: List[PlayerAction]) -> List[GameState] | None:
+    return [_EDITING_STATE]
+
+def _fromEditing(self: 'PWars', gameStates: Tuple[GameState, ...], playerActs: List[PlayerAction]) -> List[GameState] | None:
+    return [_CLAIMING_STATE, GameState.randPlayer(self, 1)]
+
+def _fromRandPlayer(self: 'PWars', gameStates: Tuple[GameState, ...], playerActs: List[PlayerAction]) -> List[GameState] | None:
+    return [GameState(2, _GS_TURN, gameStates[1].info)]
+
+def _fromClaimingTurn(self: 'PWars', gameStates: Tuple[GameState, ...], playerActs: List[PlayerAction]) -> List[GameState] | None:
+    turn = GameState.nextTurn(self, gameStates[2])
+    #Claiming ends once every player had a turn
+    if turn.info != gameStates[1].info:
+        return [turn]
+    return [_MAIN_STATE, GameState.randPlayer(self, 1)]
+
+def _mainNextTurn(self: 'PWars', gameStates: Tuple[GameState, ...]) -> List[GameState]:
+    if not any(self.remaining):
+        return [_FINAL_STATE]
+    return [GameState.nextTurn(self, gameStates[2], True)]
+
+def _fromMainTurn(self: 'PWars', gameStates: Tuple[GameState, ...], playerActs: List[PlayerAction]) -> List[GameState] | None:
+    if len(playerActs) == 1:
+        if playerActs[0].type is _PA_PLAY:
+            return [_MAINPROVE_STATE]
+        else:
+            return _mainNextTurn(self, gameStates)
+
+def _fromMainProve(self: 'PWars', gameStates: Tuple[GameState, ...], playerActs: List[PlayerAction]) -> List[GameState] | None:
+    return [_MAINEFFECT_STATE]
+
+def _fromMainEffect(self: 'PWars', gameStates: Tuple[GameState, ...], playerActs: List[PlayerAction]) -> List[GameState] | None:
+    if len(playerActs) == 1:
+        return _mainNextTurn(self, gameStates)
+
+def _fromFinal(self: 'PWars', gameStates: Tuple[GameState, ...], playerActs: List[PlayerAction]) -> List[GameState] | None:
+    return [_SUBPROOF_STATE]
+
+def _fromSubproof(self: 'PWars', gameStates: Tuple[GameState, ...], playerActs: List[PlayerAction]) -> List[GameState] | None:
+    return [_ADDRULE_STATE]
+
+def _fromAddRule(self: 'PWars', gameStates: Tuple[GameState, ...], playerActs: List[PlayerAction]) -> List[GameState] | None:
+    if len(playerActs) == 1:
+        return [_FINALPROVE_STATE]
+
+_RANDPLAYER_L1 = _stateKey(1, GameStateType.RANDPLAYER)
+_TURN_L2 = _stateKey(2, GameStateType.TURN)
+#Keys of the current game states while proving in the main phase
+_MAINPROVE_KEYS = (_MAIN_L0, _RANDPLAYER_L1, _TURN_L2, _stateKey(3, GameStateType.PROVE))
+
+#Transitions keyed by the packed keys of the current game states
+_NEXTSTATE_DISPATCH: Dict[Tuple[int, ...], Callable[['PWars', Tuple[GameState, ...], List[PlayerAction]], List[GameState] | None]] = {
+    (_INITIAL_L0,): _fromInitial,
+    (_CREATION_L0,): _fromCreation,
+    (_EDITING_L0,): _fromEditing,
+    (_CLAIMING_L0, _RANDPLAYER_L1): _fromRandPlayer,
+    (_CLAIMING_L0, _RANDPLAYER_L1, _TURN_L2): _fromClaimingTurn,
+    (_MAIN_L0, _RANDPLAYER_L1): _fromRandPlayer,
+    (_MAIN_L0, _RANDPLAYER_L1, _TURN_L2): _fromMainTurn,
+    _MAINPROVE_KEYS: _fromMainProve,
+    (_MAIN_L0, _RANDPLAYER_L1, _TURN_L2, _stateKey(3, GameStateType.EFFECT)): _fromMainEffect,
+    (_FINAL_L0,): _fromFinal,
+    (_FINAL_L0, _stateKey(1, GameStateType.SUBPROOF)): _fromSubproof,
+    (_FINAL_L0, _stateKey(1, GameStateType.ADDRULE)): _fromAddRule,
+    (_FINAL_L0, _stateKey(1, GameStateType.ADDRULE), _stateKey(2, GameStateType.PROVE)): _fromAddRule,
+}
+
 @dataclass
 class CalcInstance:
     chosenPlayer: dict[int, int] = field(default_factory=dict)
@@ -302,7 +487,6 @@ class PWars:
     MAXPOTENCYREWARD: int = 64
     players: List[Player] = field(default_factory=list)
     deck: List[Card] = field(default_factory=list)
-    history: List[Tuple[GameState | PlayerActionType]] = field(default_factory=list)
     remaining: List[bool] = field(default_factory=list)
     discardPile: List[Card] = field(default_factory=list)
     dropPile: List[Card] = field(default_factory=list)
@@ -310,6 +494,9 @@ class PWars:
     rules: Dict[int, Statement] = field(default_factory=dict)
     activeDeductions: List[Tuple[Proof, int, int]] | None = None #(proof, deriveIndex, playerID)
     playRank: List[int] | None = None #List of players in order of ranking, 0 is worst
+    #History is kept as game states, each followed by the segment of player actions after it
+    _gameStates: List[GameState] = field(default_factory=list, init=False, repr=False)
+    _segments: List[List[PlayerAction]] = field(default_factory=lambda: [[]], init=False, repr=False)
 
     def __post_init__(self):
         self.players = [Player(
@@ -318,31 +505,114 @@ class PWars:
             self.INITPOTENCY)
             for _ in range(self.INITPLAYER)
         ]
-        self.deck = [Card() for _ in range(self.INITCARDDECK)]
+        #Blank cards in the deck are only counted, they are created when taken
+        self.deck = []
+        self._deckBlankCount: int = self.INITCARDDECK
         self.remaining = [False for _ in self.players]
+        self._currentGameStates: Tuple[GameState, ...] = ()
+        #Players who acted since the latest game state
+        self._segmentPlayerSet: Set[int] = set()
+        #Inverse operations as (function, *args), each advance/action starts with None
+        self._undo: List[Tuple | None] = []
+
+    @property
+    def history(self) -> List[GameState | PlayerAction]:
+        """
+        Every game state and player action so far, in order.
+        This is a new list on every read, so changing it doesn't change the game.
+        """
+        res = list(self._segments[0])
+        for state, segment in zip(self._gameStates, self._segments[1:]):
+            res.append(state)
+            res += segment
+        return res
+
+    def _pushHistory(self, entry: GameState | PlayerAction):
+        """
+        Append an entry to the history, keeping the current game states
+        and the recent player actions up to date.
+        """
+        if isinstance(entry, GameState):
+            self._undo.append((PWars._popGameState, self, self._currentGameStates, self._segmentPlayerSet))
+            self._gameStates.append(entry)
+            self._segments.append([])
+            #A new state replaces every current state on its layer or above
+            self._currentGameStates = tuple(
+                state for state in self._currentGameStates if state.layer < entry.layer
+            ) + (entry, )
+            self._segmentPlayerSet = set()
+        else:
+            self._undo.append((PWars._popPlayerAction, self, entry.player not in self._segmentPlayerSet))
+            self._segments[-1].append(entry)
+            self._segmentPlayerSet.add(entry.player)
+
+    def _popGameState(self, oldGameStates: Tuple[GameState, ...], oldPlayerSet: Set[int]):
+        self._gameStates.pop()
+        self._segments.pop()
+        self._currentGameStates = oldGameStates
+        self._segmentPlayerSet = oldPlayerSet
 
-    def currentGameStates(self) -> Tuple[GameState]:
+    def _popPlayerAction(self, firstOfPlayer: bool):
+        playerAct = self._segments[-1].pop()
+        if firstOfPlayer: self._segmentPlayerSet.discard(playerAct.player)
+
+    def _saveAttrs(self, obj: Any, *names: str):
+        """
+        Records attributes of an object, to be restored by `undo`.
+        """
+        for name in names:
+            self._undo.append((setattr, obj, name, getattr(obj, name)))
+
+    def _saveList(self, lst: List):
+        """
+        Records the contents of a list, to be restored by `undo`.
+        """
+        self._undo.append((setitem, lst, slice(None), lst[:]))
+
+    def _saveLength(self, lst: List):
+        """
+        Records the length of a list that is only appended to, to be truncated back by `undo`.
+        """
+        self._undo.append((delitem, lst, slice(len(lst), None)))
+
+    def _saveKey(self, dic: Dict, key: Any):
+        """
+        Records a dictionary entry (or its absence), to be restored by `undo`.
+        """
+        if key in dic: self._undo.append((setitem, dic, key, dic[key]))
+        else: self._undo.append((delitem, dic, key))
+
+    def undo(self) -> 'PWars':
+        """
+        Reverts the latest advance or valid action, then returns self.
+        Random game states and effects are not rerolled.
+        The undo log keeps a reference to every value it restores, back to the
+        start of the game or the latest `clearUndo`.
+        """
+        if not self._undo: raise GameException('Nothing to undo')
+        while (entry := self._undo.pop()) is not None:
+            entry[0](*entry[1:])
+        return self
+
+    def clearUndo(self) -> 'PWars':
+        """
+        Empties the undo log, so nothing before this can be undone, then returns self.
+        """
+        self._undo.clear()
+        return self
+
+    def currentGameStates(self) -> Tuple[GameState, ...]:
         """
         Get current game states, with layers.
         """
-        res = ()
-        highestLayer = 100000
-        state: GameState
-        for state in reversed(tuple(filter(lambda x: isinstance(x, GameState), self.history))):
-            if state.layer < highestLayer:
-                highestLayer = state.layer
-                res = (state, ) + res
-        return res
+        return self._currentGameStates
 
-    def recentPlayerActions(self) -> Tuple[PlayerAction]:
+    def recentPlayerActions(self) -> Tuple[PlayerAction, ...]:
         """
         Return a list of actions taken by each player in order from most recently played action first,
         since the latest game state.
         """
-        latestGameState = next((len(self.history) - index
-                                for index, element in enumerate(self.history[::-1])
-                                if isinstance(element, GameState)), -1)
-        return tuple(self.history[latestGameState:])
+        return tuple(self._segments[-1])
 
     def startAxioms(self, opposingProofIndex: int | None) -> Tuple[Statement, ...]:
         """
@@ -351,8 +621,7 @@ class PWars:
         """
         gameStates = self.currentGameStates()
         playerActs = self.recentPlayerActions()
-        if len(gameStates) == 4 and gameStates[0].type == GameStateType.MAIN and \
-        gameStates[3].type == GameStateType.PROVE:
+        if tuple(state._key for state in gameStates) == _MAINPROVE_KEYS:
             if opposingProofIndex is None:
                 res = (self.recentPlay[0].effect, self.recentPlay[1].effect)
             else: res = tuple(playerActs[opposingProofIndex].info[1].statements)
@@ -588,7 +857,7 @@ class PWars:
                 if args[0][0] == 'card':
                     num = int(args[0][1])
                     if cI.cardObjs[num].effect is None: return Statement((('number', '0'),))
-                    else: return Statement((('number', str(cI.cardObjs[num].effect.symbolPoint())),))
+                    else: return Statement((('number', str(cI.cardObjs[num].symbolPoint())),))
                 else:
                     return originalState
             case '[powerCost]':
@@ -678,6 +947,34 @@ class PWars:
 
         return res
 
+    def _claimsBlank(self, claims: List[Tuple[int, int]]) -> bool:
+        """
+        Checks whether any of the claimed cards is blank.
+        """
+        players = self.players
+        for playerId, cardId in claims:
+            if players[playerId].cards[cardId] == _BLANK_CARD: return True
+        return False
+
+    def _claimCards(self, player: Player, claims: List[Tuple[int, int]], costMult: int = 1):
+        """
+        Moves the claimed cards to the player's hand, if the player can pay
+        the power cost of the cards multiplied by `costMult`.
+        """
+        #Look up each hand once, for both the cost and the transfer
+        claimed = [(self.players[playerId].cards, cardId) for playerId, cardId in claims]
+        powerSpent = sum(hand[cardId].powerCost for hand, cardId in claimed) * costMult
+        if powerSpent <= player.power:
+            hands = {id(hand): hand for hand, _ in claimed}
+            hands[id(player.cards)] = player.cards
+            for hand in hands.values(): self._saveList(hand)
+            self._saveAttrs(player, 'power')
+            for hand, cardId in sorted(claimed, key=itemgetter(1), reverse=True):
+            #sorted function prevents deleting elements affecting indexes
+                player.cards.append(hand[cardId])
+                del hand[cardId]
+            player.power -= powerSpent
+
 
     #Main functions
     def nextGameState(self) -> List[GameState]:
@@ -685,56 +982,16 @@ class PWars:
         Returns the next game state.
         """
         #Initial gameplay
-        if self.history == []:
-            return [GameState(0, GameStateType.INITIAL)]
+        if not self._gameStates:
+            return [_INITIAL_STATE]
 
         gameStates = self.currentGameStates()
-        playerActs = self.recentPlayerActions()
-
-        if gameStates == (GameState(0, GameStateType.INITIAL),):
-            return [GameState(0, GameStateType.CREATION)]
-        elif gameStates == (GameState(0, GameStateType.CREATION),):
-            return [GameState(0, GameStateType.EDITING)]
-        elif gameStates[0] == GameState(0, GameStateType.EDITING):
-            return [GameState(0, GameStateType.CLAIMING), GameState.randPlayer(self, 1)]
-        elif gameStates[0] == GameState(0, GameStateType.CLAIMING) \
-            and len(gameStates) == 2 and gameStates[1].type == GameStateType.RANDPLAYER:
-            return [GameState(2, GameStateType.TURN, gameStates[1].info)]
-        elif gameStates[0] == GameState(0, GameStateType.CLAIMING) \
-            and len(gameStates) == 3 and gameStates[1].type == GameStateType.RANDPLAYER and \
-                gameStates[2].type == GameStateType.TURN:
-            if GameState.nextTurn(self, gameStates[2]) \
-            != GameState(2, GameStateType.TURN, gameStates[1].info):
-                return [GameState.nextTurn(self, gameStates[2])]
-            return [GameState(0, GameStateType.MAIN), GameState.randPlayer(self, 1)]
-        elif gameStates[0] == GameState(0, GameStateType.MAIN) and \
-        gameStates[1].type == GameStateType.RANDPLAYER:
-            def nextTurn():
-                if not any(self.remaining):
-                    return [GameState(0, GameStateType.FINAL)]
-                return [GameState.nextTurn(self, gameStates[2], True)]
-            if len(gameStates) == 2:
-                return [GameState(2, GameStateType.TURN, gameStates[1].info)]
-            elif len(gameStates) == 3 and len(playerActs) == 1:
-                if playerActs[0].type == PlayerActionType.PLAY:
-                    return [GameState(3, GameStateType.PROVE)]
-                else:
-                    return nextTurn()
-            elif len(gameStates) == 4:
-                if gameStates[3].type == GameStateType.PROVE:
-                    return [GameState(3, GameStateType.EFFECT)]
-                elif gameStates[3].type == GameStateType.EFFECT and len(playerActs) == 1:
-                    return nextTurn()
-        elif gameStates[0].type == GameStateType.FINAL:
-            if len(gameStates) == 1:
-                return [GameState(1, GameStateType.SUBPROOF)]
-            if gameStates[1].type == GameStateType.SUBPROOF:
-                return [GameState(1, GameStateType.ADDRULE)]
-            if gameStates[1].type == GameStateType.ADDRULE and len(playerActs) == 1:
-                return [GameState(2, GameStateType.PROVE)]
+        handler = _NEXTSTATE_DISPATCH.get(tuple(state._key for state in gameStates))
+        res = None if handler is None else handler(self, gameStates, self._segments[-1])
+        if res is not None: return res
         raise GameException('Conditions not applied')
 
-    def advance(self):
+    def advance(self) -> 'PWars':
         """
         Advances to a new game state and returns self.
         """
@@ -743,27 +1000,37 @@ class PWars:
         oldGameStates = self.currentGameStates()
         playerActs = self.recentPlayerActions()
         nextGameStates = self.nextGameState()
-        self.history += nextGameStates
+        self._undo.append(None)
+        for state in nextGameStates: self._pushHistory(state)
         newGameStates = self.currentGameStates()
 
-        if oldGameStates == (GameState(0, GameStateType.CREATION),):
-            votes = (
-                (i, count) for i, count in ((playerAct.player, playerAct.info)
-                for playerAct in playerActs)
-            )
-            total = sum(vote[1] for vote in votes)
-            if not total > self.deck.count(Card()):
-                for i, count in votes:
-                    self.players[i].cards.extend([Card()] * count)
-        if newGameStates[0] == GameState(0, GameStateType.MAIN):
-            if newGameStates[1].type == GameStateType.RANDPLAYER and len(newGameStates) == 2:
+        if len(oldGameStates) == 1 and oldGameStates[0]._key == _CREATION_L0:
+            #Blank cards requested by each player
+            votes = bytearray(len(self.players))
+            for playerAct in playerActs:
+                if playerAct.type is _PA_TAKEBLANK:
+                    votes[playerAct.player] = playerAct.info
+            total = sum(votes)
+            if not total > self._deckBlankCount:
+                self._saveAttrs(self, '_deckBlankCount')
+                for i, count in enumerate(votes):
+                    self._saveList(self.players[i].cards)
+                    self.players[i].cards.extend(Card() for _ in range(count))
+                self._deckBlankCount -= total
+        if newGameStates[0]._key == _MAIN_L0:
+            if newGameStates[1].type is _GS_RANDPLAYER and len(newGameStates) == 2:
+                self._saveAttrs(self, 'remaining', 'discardPile', 'playRank')
+                for player in self.players: self._saveAttrs(player, 'pPower')
                 self.remaining = [True for _ in self.players]
                 self.discardPile = []
                 self.playRank = []
                 for player in self.players: player.playInit()
-            if len(newGameStates) == 4 and newGameStates[3].type == GameStateType.PROVE:
+            if len(newGameStates) == 4 and newGameStates[3].type is _GS_PROVE:
+                self._saveAttrs(self, 'activeDeductions')
                 self.activeDeductions = []
-            if len(oldGameStates) == 4 and oldGameStates[3].type == GameStateType.EFFECT:
+            if len(oldGameStates) == 4 and oldGameStates[3].type is _GS_EFFECT:
+                #Effects only change health and power
+                for player in self.players: self._saveAttrs(player, 'health', 'power')
                 #TODO: Check if proof was not disproven
                 for playerAct in playerActs:
                     proofIndex: int
@@ -773,15 +1040,18 @@ class PWars:
                     proof: Proof = self.activeDeductions[proofIndex][0]
                     inst = self.genCalcInstance(chosenPlayer, chosenCard)
                     self.applyEffect(proof.statements[self.activeDeductions[proofIndex][1]], inst)
-        if newGameStates[0].type == GameStateType.FINAL:
+        if newGameStates[0]._key == _FINAL_L0:
             if len(newGameStates) == 1:
+                self._saveAttrs(self, 'remaining', 'discardPile')
+                for player in self.players: self._saveAttrs(player, 'potency')
                 self.remaining = None
                 self.discardPile = None
                 for i, v in enumerate(self.playRank):
                     self.players[v].potency += i * self.MAXPOTENCYREWARD // self.INITPLAYER
             if len(newGameStates) >= 3 and \
-            newGameStates[1].type == GameStateType.ADDRULE and \
-            newGameStates[2].type == GameStateType.PROVE:
+            newGameStates[1].type is _GS_ADDRULE and \
+            newGameStates[2].type is _GS_PROVE:
+                self._saveAttrs(self, 'activeDeductions')
                 self.activeDeductions = []
 
         return self
@@ -796,36 +1066,34 @@ class PWars:
         valid = self.actionValid(playerAct)
         if valid:
             playerActs = self.recentPlayerActions()
-            self.history.append(playerAct)
+            self._undo.append(None)
+            self._pushHistory(playerAct)
             gameStates = self.currentGameStates()
             player = self.players[playerAct.player]
 
             #On initial gameplay, edit a card based on the player action
-            if gameStates == (GameState(0, GameStateType.INITIAL),):
+            if len(gameStates) == 1 and gameStates[0]._key == _INITIAL_L0:
+                self._saveList(player.cards)
+                self._saveAttrs(player, 'power')
                 for editing in playerAct.info:
                     player.editCard(editing[0], editing[1])
 
             #On editing phase, edit a card based on the player action
-            if gameStates == (GameState(0, GameStateType.EDITING, None),):
+            if len(gameStates) == 1 and gameStates[0]._key == _EDITING_L0:
+                self._saveList(player.cards)
+                self._saveAttrs(player, 'power')
                 for editing in playerAct.info:
                     player.editCard(editing[0], editing[1], blankCost=True)
 
             #On claiming phase, claim any card (not blank) from any player hand and buy it
-            if gameStates[0] == GameState(0, GameStateType.CLAIMING, None):
-                powerSpent = sum(self.players[playerId].cards[cardId].powerCost
-                                 for playerId, cardId in playerAct.info)
-                if powerSpent <= player.power:
-                    for playerId, cardId in sorted(playerAct.info, key=lambda x: x[1], reverse=True):
-                    #sorted function prevents deleting elements affecting indexes
-                        player.cards.append(self.players[playerId].cards[cardId])
-                        del self.players[playerId].cards[cardId]
-                    player.power -= powerSpent
+            if gameStates[0]._key == _CLAIMING_L0:
+                self._claimCards(player, playerAct.info)
 
             #On main phase, ...
-            if gameStates[0] == GameState(0, GameStateType.MAIN):
+            if gameStates[0]._key == _MAIN_L0:
                 #when proving, ...
-                if len(gameStates) == 4 and gameStates[3].type == GameStateType.PROVE:
-                    if playerAct.type == PlayerActionType.PROVE:
+                if len(gameStates) == 4 and gameStates[3].type is _GS_PROVE:
+                    if playerAct.type is _PA_PROVE:
                         #If disproving
                         if isinstance(playerAct.info[0], int):
                             try:
@@ -837,46 +1105,52 @@ class PWars:
                                 # so we pass)
                                 pass
                         else:
+                            self._saveLength(self.activeDeductions)
                             self.activeDeductions.append(playerAct.info[1:] + (playerAct.player,))
                 #if PLAY, play the pair of cards
-                elif playerAct.type == PlayerActionType.PLAY:
-                    self.dropPile += tuple(player.cards[x] for x in playerAct.info)
+                elif playerAct.type is _PA_PLAY:
+                    self._saveAttrs(self, 'recentPlay')
+                    self._saveLength(self.dropPile)
+                    self._saveList(player.cards)
                     self.recentPlay = tuple(player.cards[x] for x in playerAct.info)
+                    self.dropPile += self.recentPlay
                     #Ensure deleting the right indexes
                     del player.cards[max(playerAct.info)]
                     del player.cards[min(playerAct.info)]
                 #if DISCARD, discard card while raising its power cost by 2
-                elif playerAct.type == PlayerActionType.DISCARD:
+                elif playerAct.type is _PA_DISCARD:
+                    self._saveAttrs(player.cards[playerAct.info], 'powerCost')
+                    self._saveLength(self.discardPile)
+                    self._saveList(player.cards)
                     player.cards[playerAct.info].powerCost += 2
                     self.discardPile.append(player.cards[playerAct.info])
                     #Delete the card from their hand
                     del player.cards[playerAct.info]
                 #if UNREMAIN, leave the main phase
-                elif playerAct.type == PlayerActionType.UNREMAIN:
+                elif playerAct.type is _PA_UNREMAIN:
+                    self._saveList(self.remaining)
+                    self._saveLength(self.playRank)
                     self.remaining[playerAct.player] = False
                     self.playRank.append(playerAct.player)
                 #if CLAIMPLAY, claim the card to player for twice the power cost
-                elif playerAct.type == PlayerActionType.CLAIMPLAY:
-                    powerSpent = sum(self.players[playerId].cards[cardId].powerCost
-                                     for playerId, cardId in playerAct.info) * 2
-                    if powerSpent <= player.power:
-                        for playerId, cardId in sorted(playerAct.info, key=lambda x: x[1], reverse=True):
-                        #sorted function prevents deleting elements affecting indexes
-                            player.cards.append(self.players[playerId].cards[cardId])
-                            del self.players[playerId].cards[cardId]
-                        player.power -= powerSpent
+                elif playerAct.type is _PA_CLAIMPLAY:
+                    self._claimCards(player, playerAct.info, costMult=2)
 
             #On final phase, ...
-            if gameStates[0] == GameState(0, GameStateType.FINAL):
+            if gameStates[0]._key == _FINAL_L0:
                 #when subproof, ...
-                if gameStates[1].type == GameStateType.SUBPROOF:
+                if gameStates[1].type is _GS_SUBPROOF:
                     #if SUBPROOF, buy a subproof
-                    if playerAct.type == PlayerActionType.SUBPROOF:
+                    if playerAct.type is _PA_SUBPROOF:
+                        self._saveLength(player.subproofs)
+                        self._saveAttrs(player, 'potency')
                         player.subproofs.append(playerAct.info)
                         player.potency -= playerAct.info.symbolPoint() * 2
                 #if ADDRULE, add a valid rule
-                if playerAct.type == PlayerActionType.ADDRULE:
+                if playerAct.type is _PA_ADDRULE:
                     index, state, cost = playerAct.info
+                    self._saveKey(self.rules, index)
+                    self._saveAttrs(player, 'potency')
                     self.rules[index] = state
                     player.potency -= cost
 
@@ -887,79 +1161,71 @@ class PWars:
         Checks whether the given action is valid.
         """
         gameStates = self.currentGameStates()
-        playerActs = self.recentPlayerActions()
+        #Only read here, so the segment is not copied like in `recentPlayerActions`
+        playerActs = self._segments[-1]
         player = self.players[playerAct.player]
 
         if len(gameStates) == 0: return False
-        if playerAct.valid(PlayerActionType.DEBUGACT): return True
+        if playerAct.valid(_PA_DEBUGACT): return True
 
         #Initial gameplay
-        if gameStates == (GameState(0, GameStateType.INITIAL, None),) and \
-        all(playerAct.valid(PlayerActionType.EDIT) for playerAct in playerActs + (playerAct,)):
+        #(earlier actions of the same game state were checked when they were taken)
+        if len(gameStates) == 1 and gameStates[0]._key == _INITIAL_L0 and \
+        playerAct.valid(_PA_EDIT):
             return True
 
         #Creation phase
-        if gameStates == (GameState(0, GameStateType.CREATION, None),) and \
-        all(playerAct.valid(PlayerActionType.TAKEBLANK)
-            for playerAct in playerActs + (playerAct,)) and \
-        _allUnique(playerActs + (playerAct,), key=lambda x: x.player):
+        if len(gameStates) == 1 and gameStates[0]._key == _CREATION_L0 and \
+        playerAct.valid(_PA_TAKEBLANK) and \
+        playerAct.player not in self._segmentPlayerSet:
             return True
 
         #Editing phase
-        if gameStates == (GameState(0, GameStateType.EDITING, None),) and \
-        all(playerAct.valid(PlayerActionType.EDIT) for playerAct in playerActs + (playerAct,)) and \
-        _allUnique(playerActs + (playerAct,), key=lambda x: x.player):
+        if len(gameStates) == 1 and gameStates[0]._key == _EDITING_L0 and \
+        playerAct.valid(_PA_EDIT) and \
+        playerAct.player not in self._segmentPlayerSet:
             return True
 
         #Claiming phase
-        if gameStates[0] == GameState(0, GameStateType.CLAIMING, None) and \
-        len(gameStates) == 3 and gameStates[2].type == GameStateType.TURN and \
-        all(playerAct.valid(PlayerActionType.CLAIM)
-            for playerAct in playerActs + (playerAct,)) and \
+        if gameStates[0]._key == _CLAIMING_L0 and \
+        len(gameStates) == 3 and gameStates[2].type is _GS_TURN and \
         len(playerActs) == 0 and playerAct.player == gameStates[2].info and \
-        len(playerAct.info) <= FAIR_NUMBER and not \
-        any(self.players[playerId].cards[cardId] == Card() for playerId, cardId in playerAct.info):
+        playerAct.valid(_PA_CLAIM) and \
+        len(playerAct.info) <= FAIR_NUMBER and not self._claimsBlank(playerAct.info):
             return True
 
         #Main phase
-        if gameStates[0] == GameState(0, GameStateType.MAIN) and self.remaining[playerAct.player]:
+        if gameStates[0]._key == _MAIN_L0 and self.remaining[playerAct.player]:
             #Before proving game state
-            if len(gameStates) == 3 and gameStates[2].type == GameStateType.TURN and \
+            if len(gameStates) == 3 and gameStates[2].type is _GS_TURN and \
             len(playerActs) == 0 and \
-            playerAct.valid(
-                (PlayerActionType.PLAY,
-                 PlayerActionType.DISCARD,
-                 PlayerActionType.CLAIMPLAY,
-                 PlayerActionType.UNREMAIN
-                )):
+            playerAct.valid(_MAINPHASE_TYPES):
                 #Playing action
-                if playerAct.type == PlayerActionType.PLAY:
+                if playerAct.type is _PA_PLAY:
                     mainCard: Card = player.cards[playerAct.info[0]]
+                    secCard: Card = player.cards[playerAct.info[1]]
 
                     #Make sure not to play blank cards
-                    if Card() in (mainCard, player.cards[playerAct.info[1]]): return False
-                    if mainCard.effect.symbolPoint() > player.cards[playerAct.info[1]].effect.symbolPoint():
+                    if _BLANK_CARD in (mainCard, secCard): return False
+                    if mainCard.symbolPoint() > secCard.symbolPoint():
                         return False
                     if self.recentPlay is not None:
                         oppoMainCard: Card = self.recentPlay[0]
                         if mainCard.powerCost > oppoMainCard.powerCost: return False
                         if (not oppoMainCard.tag.beat(mainCard.tag)) or \
-                        (mainCard.effect.symbolPoint() < oppoMainCard.effect.symbolPoint()):
+                        (mainCard.symbolPoint() < oppoMainCard.symbolPoint()):
                             return True
                     else: return True
                 #Discard and unremain action
-                elif playerAct.type in [PlayerActionType.DISCARD, PlayerActionType.UNREMAIN]:
+                elif playerAct.type in (_PA_DISCARD, _PA_UNREMAIN):
                     return True
                 #Claim action in main phase
-                if playerAct.type == PlayerActionType.CLAIMPLAY:
+                if playerAct.type is _PA_CLAIMPLAY:
                     return len(playerAct.info) <= FAIR_NUMBER and \
-                    all(
-                        self.players[playerId].cards[cardId] != Card()
-                        for playerId, cardId in playerAct.info
-                    )
+                    not self._claimsBlank(playerAct.info)
             #Proving game state
-            if len(gameStates) == 4 and gameStates[3].type == GameStateType.PROVE and \
-            playerAct.valid(PlayerActionType.PROVE):
+            if len(gameStates) == 4 and gameStates[3].type is _GS_PROVE and \
+            playerAct.valid(_PA_PROVE):
                 proof: Proof = playerAct.info[1]
 
                 #If disproving:
@@ -977,36 +1243,32 @@ class PWars:
                     return False
 
                 axioms = self.startAxioms(playerAct.info[0])
-                proofAxioms = tuple(
-                    state for state, tag in
-                    zip(proof.statements, proof.stateTags) if tag == StateTag.AXIOM
-                )
-                return axioms == proofAxioms
+                return axioms == proof.axioms()
 
             #Effect game state
-            if len(gameStates) == 4 and gameStates[3].type == GameStateType.EFFECT and \
-            playerAct.valid(PlayerActionType.EFFECTCHOOSE) and self.activeDeductions[playerAct.info[0]][2] == playerAct.player:
+            if len(gameStates) == 4 and gameStates[3].type is _GS_EFFECT and \
+            playerAct.valid(_PA_EFFECTCHOOSE) and self.activeDeductions[playerAct.info[0]][2] == playerAct.player:
                 return len(playerActs) == 0
 
-        if gameStates[0] == GameState(0, GameStateType.FINAL) and len(gameStates) >= 2:
+        if gameStates[0]._key == _FINAL_L0 and len(gameStates) >= 2:
             #Subproof game state
-            if gameStates[1].type == GameStateType.SUBPROOF and \
-            playerAct.valid(PlayerActionType.SUBPROOF) and \
+            if gameStates[1].type is _GS_SUBPROOF and \
+            playerAct.valid(_PA_SUBPROOF) and \
             player.potency >= playerAct.info.symbolPoint():
                 return not playerAct.info.contradictory()
 
             #Rule adding game state
-            if gameStates[1].type == GameStateType.ADDRULE:
+            if gameStates[1].type is _GS_ADDRULE:
                 if len(gameStates) == 2 and \
-                playerAct.valid(PlayerActionType.ADDRULE) and \
+                playerAct.valid(_PA_ADDRULE) and \
                 len(playerActs) < 1:
                     index, state, cost = playerAct.info
                     return self.rules.get(index, -1) == -1 and \
                     index in range(0, 64) and \
                     player.potency >= cost and \
                     cost >= 3 * state.symbolPoint()
-                elif gameStates[2].type == GameStateType.PROVE and \
-                playerAct.valid(PlayerActionType.PROVE):
+                elif gameStates[2].type is _GS_PROVE and \
+                playerAct.valid(_PA_PROVE):
                     proof: Proof = playerAct.info[1]
 
                     #If disproving:
@@ -1024,11 +1286,7 @@ class PWars:
                         return False
 
                     axioms = self.startAxioms(playerAct.info[0])
-                    proofAxioms = tuple(
-                        state for state, tag in
-                        zip(proof.statements, proof.stateTags) if tag == StateTag.AXIOM
-                    )
-                    return axioms == proofAxioms
+                    return axioms == proof.axioms()
 
         ...
         return False
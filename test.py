@@ -367,6 +367,9 @@ res = proof.syms()
 test('ProofBase.syms', set(res) == {('pred', '16'), ('pred', '17'), ('pred', '18'), ('pred', '1'), ('pred', '2'), ('var', '24'), ('var', '25'), ('var', '26')}, res)
 res = proof.symsWithout(2)
 test('ProofBase.symsWithout', set(res) == {('pred', '16'), ('pred', '17'), ('pred', '18'), ('var', '24'), ('var', '25')}, res)
+proof = pd.ProofBase.convert(('P', 'Q'), [(pd.InferType.Addition, 0, None, '', 0)])
+res = proof.axioms()
+test('ProofBase.axioms', res == tuple(proof.statements[:2]) and len(proof.statements) == 3, res)
 
 proof = pd.ProofBase.convert(('P(b, c, c_0, d, d_0, d_1, e_0, e_1)',))
 class DeterministicRNG: #Credit to an AI chatbot
@@ -732,6 +735,38 @@ test('ProofBase.symbolPoint', res == 49, res)
 
 
 
+res = [(tag1, tag2) for tag1 in pw.CardTag for tag2 in pw.CardTag if tag1.beat(tag2)]
+test('CardTag.beat', res == [
+    (pw.CardTag.ROCK, pw.CardTag.SCISSORS),
+    (pw.CardTag.PAPER, pw.CardTag.ROCK),
+    (pw.CardTag.SCISSORS, pw.CardTag.PAPER)], res)
+
+card = pw.Card(blank=False, effect=pd.Statement.lex('[ATK]([chosenPlayer](0), 10)'))
+res = [card.symbolPoint()]
+card.effect = pd.Statement.lex('P')
+res.append(card.symbolPoint())
+test('Card.symbolPoint', res == [
+    pd.Statement.lex('[ATK]([chosenPlayer](0), 10)').symbolPoint(),
+    card.effect.symbolPoint()], res)
+
+res = [pw.GameState(2, pw.GameStateType.TURN, 3), pw.GameState(0, pw.GameStateType.MAIN), pw.GameState(1, pw.GameStateType.RANDPLAYER, 0)]
+res2 = [pw.GameState.unpack(state.pack()) for state in res]
+test('GameState.pack', res2 == res and len(set(state.pack() for state in res)) == 3, res2)
+
+game = pw.PWars()
+game.remaining = [True, False, False, True]
+res = [pw.GameState.nextTurn(game, pw.GameState(2, pw.GameStateType.TURN, i)).info for i in range(4)]
+res2 = [pw.GameState.nextTurn(game, pw.GameState(2, pw.GameStateType.TURN, i), True).info for i in range(4)]
+test('GameState.nextTurn', res == [1, 2, 3, 0] and res2 == [3, 3, 3, 0], (res, res2))
+
+game = pw.PWars()
+game.players = game.players[:3]
+game.remaining = [True, True, False]
+res = [pw.GameState.nextTurn(game, pw.GameState(2, pw.GameStateType.TURN, i), True).info for i in range(3)]
+test('GameState.nextTurn players changed', res == [1, 0, 0], res)
+
+test('PWars.__eq__ history', pw.PWars() == pw.PWars() and pw.PWars() != pw.PWars().advance(), None)
+
 game = pw.PWars().advance()
 test('PWars.advance 1', game.history == [pw.GameState(0, pw.GameStateType.INITIAL, None)], game.history)
 test('PWars.currentGameStates 1', game.currentGameStates() == (pw.GameState(0, pw.GameStateType.INITIAL, None),), game.currentGameStates())
@@ -775,11 +810,30 @@ game.action(pw.PlayerAction(
     pw.PlayerActionType.TAKEBLANK,
     5,
 ))
+res = game.action(pw.PlayerAction(
+    1,
+    pw.PlayerActionType.TAKEBLANK,
+    1,
+))
+test('PWars.actionValid 1 TAKEBLANK twice', not res, res)
 test('PWars.recentPlayerActions 3 TAKEBLANK', game.recentPlayerActions() == (
     pw.PlayerAction(player=0, type=pw.PlayerActionType.TAKEBLANK, info=2),
     pw.PlayerAction(player=1, type=pw.PlayerActionType.TAKEBLANK, info=3),
     pw.PlayerAction(player=2, type=pw.PlayerActionType.TAKEBLANK, info=5),), game.recentPlayerActions())
 game.advance()
+res = [len(player.cards) for player in game.players]
+test('PWars.advance 5 TAKEBLANK', res == [4, 5, 7], res)
+res = [id(card) for player in game.players for card in player.cards]
+test('PWars.advance 6 TAKEBLANK distinct cards', len(set(res)) == len(res) and \
+     len({id(player) for player in game.players}) == len(game.players), res)
+res = game.history
+game.undo()
+res2 = [len(player.cards) for player in game.players]
+test('PWars.undo 1 advance', game.currentGameStates() == (pw.GameState(0, pw.GameStateType.CREATION),) and \
+     res2 == [2, 2, 2] and len(game.recentPlayerActions()) == 3, (game.currentGameStates(), res2))
+game.advance()
+res2 = [len(player.cards) for player in game.players]
+test('PWars.undo 2 advance', game.history == res and res2 == [4, 5, 7], res2)
 test('PWars.nextGameStates 1 advance', game.history[-1] == pw.GameState(layer=0, type=pw.GameStateType.EDITING, info=None)
      , game.history[-1])
 game.action(pw.PlayerAction(
@@ -806,6 +860,16 @@ game.action(pw.PlayerAction(
     [(1, 0)],
 ))
 test('PWars.action 1 CLAIM', res2 - game.players[res[2].info].power == 5, game.players[res[2].info].power)
+res3 = [list(player.cards) for player in game.players]
+game.undo()
+test('PWars.undo 3 CLAIM', game.players[res[2].info].power == res2 and len(game.recentPlayerActions()) == 0 and \
+     sum(len(player.cards) for player in game.players) == sum(len(cards) for cards in res3), game.players[res[2].info].power)
+game.action(pw.PlayerAction(
+    res[2].info,
+    pw.PlayerActionType.CLAIM,
+    [(1, 0)],
+))
+test('PWars.undo 4 CLAIM', [player.cards for player in game.players] == res3, res3)
 game.advance()
 res = game.currentGameStates()
 test('PWars.currentGameState 6 CLAIM', res[0] == pw.GameState(layer=0, type=pw.GameStateType.CLAIMING, info=None) and res[1].type == pw.GameStateType.RANDPLAYER and res[2].type == pw.GameStateType.TURN and \
@@ -941,6 +1005,21 @@ res3 = game.action(pw.PlayerAction(
 ))
 res4 = game.players[res[2].info].cards == list(res2[1:]) and len(game.discardPile) == 1
 test('PWars.action 3 DISCARD', res4, False)
+if res3:
+    res5 = res2[0].powerCost
+    game.undo()
+    res4 = len(game.discardPile) == 0 and tuple(game.players[res[2].info].cards) == res2 and res2[0].powerCost == res5 - 2
+    test('PWars.undo 5 DISCARD', res4, (game.discardPile, res2[0].powerCost))
+    res3 = game.action(pw.PlayerAction(
+        res[2].info,
+        pw.PlayerActionType.DISCARD,
+        0
+    ))
+    game.clearUndo()
+    try: game.undo()
+    except pw.GameException: res4 = True
+    else: res4 = False
+    test('PWars.clearUndo', res4 and len(game.discardPile) == 1, game.discardPile)
 if not res3:
     #Skip action in case of failure
     game.action(pw.PlayerAction(res[2].info, pw.PlayerActionType.DEBUGACT))